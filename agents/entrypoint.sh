@@ -87,4 +87,4 @@ PYCODE2
 cd "$PROJECT_ROOT"
 export PYTHONPATH="$PROJECT_ROOT"
 export ADK_SUPPRESS_EXPERIMENTAL_FEATURE_WARNINGS="True"
-exec uv run uvicorn "app._agent_wrapper_${AGENT_NAME}:app" --host 0.0.0.0 --port "$PORT"
+exec uv run uvicorn "app._agent_wrapper_${AGENT_NAME}:app" --host 0.0.0.0 --port "$PORT" --loop uvloop --http httptools
@@ -2,24 +2,35 @@
 Threat Modeler Orchestrator Agent
 
 Uses ADK's SequentialAgent and LoopAgent to orchestrate the threat modeling workflow.
-- Architecture Parser → Threat Modeler Router → (MEASTRO or standard) Threat Modeler → Report Builder → [Loop: Verifier → Escalation Checker] → Summary
+- [Parallel: Architecture Parser | Threat Modeler Bootstrap] → Threat Modeler Router → (MEASTRO or standard) Threat Modeler → Report Builder → [Loop: Verifier → Escalation Checker] → Summary
+- The bootstrap enumerates candidate threats from the raw input while the parser builds the architecture summary;
+  the routed threat modeler then refines that enumeration against the summary.
 - The loop continues until verifier gives a "pass" status (escalation condition met)
 - When the architecture parser detects AI/Agentic flows, the router sends output to the MEASTRO threat modeler; otherwise to the standard threat modeler.
+- The final report is rendered to PDF in the background (no LLM turn), so the run does not wait on PDF layout.
 """
 
+import hashlib
+import logging
+import os
 import re
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from typing import Any
 
-from google.adk.agents import Agent, LoopAgent, SequentialAgent
+from google.adk.agents import Agent, LoopAgent, ParallelAgent, SequentialAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event, EventActions
 
 from agents.architecture_parser.agent import root_agent as architecture_parser
 from agents.meastro_threat_modeler.agent import root_agent as meastro_threat_modeler
+from agents.report_builder.agent import pdf_emitter_agent
 from agents.report_builder.agent import root_agent as report_builder
 from agents.report_verifier.agent import root_agent as report_verifier
 from agents.threat_modeler.agent import root_agent as threat_modeler
+from agents.threat_modeler.agent import threat_modeler_bootstrap_agent as threat_modeler_bootstrap
+
+logger = logging.getLogger(__name__)
 
 # Pattern to parse "Threat Modeler Routing: meastro_threat_modeler_agent" or "threat_modeler_agent" from architecture summary
 THREAT_MODELER_ROUTING_PATTERN = re.compile(
@@ -54,7 +65,7 @@ class ThreatModelerRouter(Agent):
             use_meastro = False
 
         chosen = self._meastro if use_meastro else self._standard
-        print(f"[ThreatModelerRouter] Using {'MEASTRO' if use_meastro else 'standard'} threat modeler.")
+        logger.info("[ThreatModelerRouter] Using %s threat modeler.", "MEASTRO" if use_meastro else "standard")
         async for event in chosen.run_async(ctx):
             yield event
 
@@ -66,6 +77,31 @@ threat_modeler_router = ThreatModelerRouter(
 
 # Define the remote agents
 
+# "status" field of a verifier verdict that reached state as raw JSON text instead of a parsed dict
+_STATUS_FIELD_PATTERN = re.compile(r'"status"\s*:\s*"(\w+)"')
+
+
+def _verdict_status(feedback: Any) -> str:
+    """Status of a verification_feedback value (pydantic model, dict or raw JSON string); "fail" if unknown."""
+    if isinstance(feedback, dict):
+        return feedback.get("status") or "fail"
+    if isinstance(feedback, str):
+        match = _STATUS_FIELD_PATTERN.search(feedback)
+        return match.group(1) if match else "fail"
+    return getattr(feedback, "status", None) or "fail"
+
+
+# Upper bound on remembered verifier verdicts (oldest evicted first)
+VERDICT_CACHE_MAX_ENTRIES = 1024
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _report_digest(report: str, session_id: str) -> bytes:
+    """SHA-256 of the whitespace-normalized report, scoped to the session and the active model."""
+    normalized = _WHITESPACE_PATTERN.sub(" ", report).strip()
+    model = os.environ.get("GOOGLE_GENAI_MODEL", "")
+    return hashlib.sha256(f"{session_id}\0{model}\0{normalized}".encode()).digest()
+
 
 class EscalationChecker(Agent):
     """
@@ -74,6 +110,7 @@ class EscalationChecker(Agent):
     This agent examines the verification results from report_verifier and:
     - If status is "pass", keeps verification_feedback in session state so the
       report_builder_agent (run after the loop) can set the report Status to Approved,
+      records the approved report's hash for the PreEscalationGate,
       then returns escalation signal to break the loop.
     - If status is not "pass", returns continue signal to loop again.
     """
@@ -82,20 +119,20 @@ class EscalationChecker(Agent):
         """Check verification status and escalate if approved."""
         state = ctx.session.state or {}
         feedback: Any = state.get("verification_feedback")
-        status: str = (
-            getattr(feedback, "status", None)
-            or (feedback.get("status") if isinstance(feedback, dict) else None)
-            or "fail"
-        )
+        status = _verdict_status(feedback)
         is_passed = status == "pass"
-        print(f"[EscalationChecker] Verification feedback: {status}")
+        logger.info("[EscalationChecker] Verification feedback: %s", status)
 
         if ctx.session.state is not None:
             ctx.session.state["report_verification_status"] = status
         if is_passed:
             if feedback is not None and ctx.session.state is not None:
                 ctx.session.state["verification_feedback"] = feedback
-            yield Event(author=self.name, actions=EventActions(escalate=True))
+            state_delta: dict[str, Any] = {}
+            report = state.get("threat_model_report_content")
+            if isinstance(report, str) and report.strip():
+                state_delta["_last_passed_report_hash"] = _report_digest(report, ctx.session.id).hex()
+            yield Event(author=self.name, actions=EventActions(escalate=True, state_delta=state_delta))
         else:
             yield Event(author=self.name)
 
@@ -103,6 +140,87 @@ class EscalationChecker(Agent):
 escalation_checker_agent = EscalationChecker(name="escalation_checker")
 
 
+class PreEscalationGate(Agent):
+    """
+    Exits the verification loop before the verifier runs when the report builder produced
+    a report identical (after whitespace normalization) to one already approved in this session.
+
+    Writes a cached "pass" verdict to verification_feedback and escalates, so an unchanged,
+    already-approved report costs no verifier LLM call. Any edit, however small, is verified.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state or {}
+        report = state.get("threat_model_report_content")
+        last_passed = state.get("_last_passed_report_hash")
+        if last_passed and isinstance(report, str) and _report_digest(report, ctx.session.id).hex() == last_passed:
+            logger.info("[PreEscalationGate] Report unchanged since it was approved; skipping verification.")
+            yield Event(
+                author=self.name,
+                actions=EventActions(
+                    escalate=True,
+                    state_delta={
+                        "verification_feedback": {"status": "pass", "feedback": "cached"},
+                        "report_verification_status": "pass",
+                    },
+                ),
+            )
+        else:
+            yield Event(author=self.name)
+
+
+pre_escalation_gate = PreEscalationGate(name="pre_escalation_gate")
+
+
+class CachingVerifier(Agent):
+    """
+    Wraps report_verifier with a process-local verdict cache keyed on the session and the report content.
+
+    When the report builder re-emits a report that only differs in whitespace (or not at all)
+    from one already verified in the same session, the prior verdict is written back to
+    verification_feedback instead of spending another verifier LLM call. Verdicts are never
+    shared across sessions, since the verifier's feedback reflects the whole session conversation.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._verifier = report_verifier
+        self._verdicts: OrderedDict[bytes, Any] = OrderedDict()
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state or {}
+        report = state.get("threat_model_report_content")
+        if not isinstance(report, str) or not report.strip():
+            async for event in self._verifier.run_async(ctx):
+                yield event
+            return
+
+        digest = _report_digest(report, ctx.session.id)
+        cached = self._verdicts.get(digest)
+        if cached is not None:
+            self._verdicts.move_to_end(digest)
+            logger.info("[CachingVerifier] Report unchanged since a previous verification; reusing verdict.")
+            yield Event(author=self.name, actions=EventActions(state_delta={"verification_feedback": cached}))
+            return
+
+        feedback: Any = None
+        async for event in self._verifier.run_async(ctx):
+            if event.actions and "verification_feedback" in event.actions.state_delta:
+                feedback = event.actions.state_delta["verification_feedback"]
+            yield event
+
+        if feedback is not None:
+            self._verdicts[digest] = feedback
+            if len(self._verdicts) > VERDICT_CACHE_MAX_ENTRIES:
+                self._verdicts.popitem(last=False)
+
+
+caching_verifier = CachingVerifier(
+    name="caching_report_verifier",
+    description="Runs the report verifier, reusing the previous verdict when the report content is unchanged.",
+)
+
+
 class FinalReportBuilderRunner(Agent):
     """
     Runs the report_builder agent one more time after the verification loop.
@@ -118,13 +236,7 @@ class FinalReportBuilderRunner(Agent):
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         state = ctx.session.state or {}
         if state.get("report_verification_status") is None and state.get("verification_feedback") is not None:
-            feedback = state["verification_feedback"]
-            status = (
-                getattr(feedback, "status", None)
-                or (feedback.get("status") if isinstance(feedback, dict) else None)
-                or "fail"
-            )
-            ctx.session.state["report_verification_status"] = status
+            ctx.session.state["report_verification_status"] = _verdict_status(state["verification_feedback"])
         async for event in self._report_builder.run_async(ctx):
             yield event
 
@@ -134,25 +246,34 @@ final_report_builder_runner = FinalReportBuilderRunner(
     description="Runs report builder after verification loop to set Status to Approved when pass.",
 )
 
-# Create the verification loop: report_builder → report_verifier → escalation_checker
+# Create the verification loop: report_builder → pre_escalation_gate → report_verifier (cached) → escalation_checker
 # This loop continues until the escalation checker signals completion (when status == "pass")
 verification_loop = LoopAgent(
     name="verification_loop",
     description="Loops between report builder, report verifier, and escalation checker until report is approved",
-    sub_agents=[report_builder, report_verifier, escalation_checker_agent],
+    sub_agents=[report_builder, pre_escalation_gate, caching_verifier, escalation_checker_agent],
     # The loop continues until the verifier approves the report or hits max iterations
     max_iterations=3,
 )
 
+# Architecture parsing and the first-pass threat enumeration both only need the raw input,
+# so they run concurrently; each writes its own output_key (architecture_summary / initial_threat_enumeration).
+front_stage = ParallelAgent(
+    name="front_stage",
+    description="Runs the architecture parser and the threat enumeration bootstrap concurrently on the raw input",
+    sub_agents=[architecture_parser, threat_modeler_bootstrap],
+)
+
 # Create orchestration pipeline with looping verification
-# Architecture Parser → Threat Modeler Router → (MEASTRO or standard) Threat Modeler → [Loop: Report Builder → Verifier → Escalation Checker] → Final Report Builder run (set Status to Approved when pass)
+# [Parallel: Architecture Parser | Threat Modeler Bootstrap] → Threat Modeler Router → (MEASTRO or standard) Threat Modeler → [Loop: Report Builder → Pre-Escalation Gate → Verifier → Escalation Checker] → Final Report Builder run (set Status to Approved when pass) → PDF Emitter (background render of the final report)
 root_agent = SequentialAgent(
     name="threat_model_orchestrator",
     description="Orchestrates threat modeling analysis with iterative report verification and refinement",
     sub_agents=[
-        architecture_parser,
+        front_stage,
         threat_modeler_router,
         verification_loop,
         final_report_builder_runner,
+        pdf_emitter_agent,
     ],
 )
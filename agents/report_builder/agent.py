@@ -2,15 +2,25 @@
 Report Builder Agent
 
 Compiles threat model findings into a comprehensive, professional security report.
+The PDF rendering of the final report is done by pdf_emitter_agent, outside the LLM turn.
 """
 
+import logging
 import os
+from collections.abc import AsyncGenerator
 
-from shared.tools.file_writer_tool import convert_markdown_to_pdf, write_file
+from google.adk.agents import Agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+from shared.tools import pdf_worker
+from shared.tools.file_writer_tool import write_file
 from shared.tools.mermaid_to_png import mermaid_to_png
 from shared.utils.agent_factory import create_agent
 from shared.utils.file_loader import load_instructions_file
 
+logger = logging.getLogger(__name__)
+
 # Resolve paths relative to this file's directory
 current_dir = os.path.dirname(os.path.abspath(__file__))
 instructions_path = os.path.join(current_dir, "instructions.yaml")
@@ -18,13 +28,54 @@ instructions_path = os.path.join(current_dir, "instructions.yaml")
 DEFAULT_MODEL = "gemini-3-flash-preview"
 MODEL_NAME = os.environ.get("GOOGLE_GENAI_MODEL", DEFAULT_MODEL)
 
+
+def _start_pdf_worker(callback_context) -> None:
+    """Bring the PDF worker up while the report is being written, so pdf_emitter_agent finds it warm."""
+    pdf_worker.start()
+
+
 report_builder_agent = create_agent(
     name="report_builder_agent",
     description="Compiles threat model findings into a comprehensive, professional security report.",
     instruction=load_instructions_file(instructions_path),
     output_key="threat_model_report_content",
     model=MODEL_NAME,
-    tools=[write_file, convert_markdown_to_pdf, mermaid_to_png],
+    tools=[write_file, mermaid_to_png],
+    before_agent_callback=_start_pdf_worker,
+)
+
+
+class PdfEmitter(Agent):
+    """
+    Renders state["threat_model_report_content"] to PDF without an LLM turn.
+
+    The render is queued to the long-lived PDF worker process, so the pipeline can finish
+    without waiting on PDF layout. Per session, a reports/.pdf_pending_<token> marker exists
+    until the worker has rendered the report, then reports/.pdf_ready_<token> names the PDF, so
+    the server's latest-pdf endpoint can wait for and return this session's PDF.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        content = (ctx.session.state or {}).get("threat_model_report_content")
+        if isinstance(content, str) and content.strip():
+            os.makedirs("reports", exist_ok=True)
+            token = pdf_worker.pdf_session_token(ctx.session.id)
+            marker_path = os.path.join("reports", pdf_worker.PDF_PENDING_PREFIX + token)
+            ready_path = os.path.join("reports", pdf_worker.PDF_READY_PREFIX + token)
+            open(marker_path, "w").close()
+            try:
+                os.remove(ready_path)  # A previous run in this session; its PDF is superseded
+            except FileNotFoundError:
+                pass
+            pdf_worker.submit(content, marker_path, ready_path)
+        else:
+            logger.warning("No report content in session state; skipping PDF generation.")
+        yield Event(author=self.name)
+
+
+pdf_emitter_agent = PdfEmitter(
+    name="pdf_emitter_agent",
+    description="Renders the final Markdown threat model report to PDF in the background.",
 )
 
 root_agent = report_builder_agent
@@ -5,11 +5,13 @@ import os
 from google.adk.tools.google_search_tool import google_search
 
 from shared.utils.agent_factory import create_agent
-from shared.utils.file_loader import load_instructions_file
+from shared.utils.file_loader import load_instructions_files
 
 # Resolve paths relative to this file's directory
 current_dir = os.path.dirname(os.path.abspath(__file__))
 instructions_path = os.path.join(current_dir, "instructions.yaml")
+bootstrap_instructions_path = os.path.join(current_dir, "bootstrap_instructions.yaml")
+instructions = load_instructions_files([instructions_path, bootstrap_instructions_path])
 
 DEFAULT_MODEL = "gemini-3-flash-preview"
 MODEL_NAME = os.environ.get("GOOGLE_GENAI_MODEL", DEFAULT_MODEL)
@@ -17,10 +19,20 @@ MODEL_NAME = os.environ.get("GOOGLE_GENAI_MODEL", DEFAULT_MODEL)
 threat_modeler_agent = create_agent(
     name="threat_modeler_agent",
     description="Identifies potential security threats and vulnerabilities based on system architecture and data flows.",
-    instruction=load_instructions_file(instructions_path),
+    instruction=instructions[instructions_path],
     output_key="raw_threat_model",
     model=MODEL_NAME,
     tools=[google_search],
 )
 
+# First-pass enumeration on the raw input; runs alongside the architecture parser so the
+# threat modeler above only has to refine it once `architecture_summary` is available.
+threat_modeler_bootstrap_agent = create_agent(
+    name="threat_modeler_bootstrap_agent",
+    description="Enumerates candidate threats directly from the raw architecture input, in parallel with the architecture parser.",
+    instruction=instructions[bootstrap_instructions_path],
+    output_key="initial_threat_enumeration",
+    model=MODEL_NAME,
+)
+
 root_agent = threat_modeler_agent
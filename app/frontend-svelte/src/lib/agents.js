@@ -30,6 +30,12 @@ export const NEXT_AGENT_IDS = {
   verifier: [],
 };
 
+/**
+ * Agents that run in the background (no pipeline step of their own). Their events must not
+ * drive step status, and their text is intermediate state, not part of the report.
+ */
+const BACKGROUND_AUTHORS = ["threat_modeler_bootstrap"];
+
 const AUTHOR_TO_ID = {
   threat_model_orchestrator: "orchestrator",
   orchestrator: "orchestrator",
@@ -57,6 +63,16 @@ export function getAgentConfig(id) {
   return CONFIG_BY_ID[id];
 }
 
+/**
+ * @param {string} author - Author string from stream event
+ * @returns {boolean} true for background agents (e.g. the threat enumeration bootstrap)
+ */
+export function isBackgroundAuthor(author) {
+  if (!author) return false;
+  const lower = String(author).toLowerCase();
+  return BACKGROUND_AUTHORS.some((key) => lower.includes(key));
+}
+
 /**
  * @param {string} author - Author string from stream event
  * @returns {string} agent id for status display
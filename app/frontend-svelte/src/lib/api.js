@@ -208,8 +208,16 @@ export async function streamQuery(
   }
 }
 
-export async function getLatestPdf() {
-  const response = await fetch(`${API_BASE}/api/reports/latest-pdf`);
+/**
+ * Latest PDF report info (scoped to sessionId when given).
+ * Resolves to { pending: true } while the server is still rendering the PDF (HTTP 202).
+ */
+export async function getLatestPdf(sessionId) {
+  const query = sessionId
+    ? `?session_id=${encodeURIComponent(sessionId)}`
+    : "";
+  const response = await fetch(`${API_BASE}/api/reports/latest-pdf${query}`);
+  if (response.status === 202) return { pending: true };
   if (!response.ok) return null;
   return response.json();
 }
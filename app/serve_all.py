@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Serve every agent from a single ASGI process.
+
+Alternative to serve_agents.py: instead of one uvicorn subprocess (and one interpreter, ADK
+import and connection pool) per agent, the agents directory is loaded into a single ADK
+FastAPI app. ADK already routes by app name (/list-apps, /apps/<agent>/..., /run_sse), so
+every agent, including the orchestrator, is reachable on one port. Point the frontend server
+at it with ORCHESTRATOR_URL=http://localhost:8006.
+
+This runs a single worker. /set-api-key applies the API key, Vertex settings and model to
+the process-wide environment, so a request landing on another worker would run with that
+worker's credentials; the verifier verdict cache and the PDF worker are process-local too.
+(Sessions themselves are persisted by ADK per agent under agents/<agent>/.adk/session.db.)
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# Suppress OpenTelemetry attribute warnings for None values
+logging.getLogger("opentelemetry.attributes").setLevel(logging.ERROR)
+# Suppress google_genai "non-text parts (function_call)" warning; ADK handles tool calls.
+logging.getLogger("google_genai.types").setLevel(logging.ERROR)
+logger = logging.getLogger(__name__)
+
+os.environ.setdefault("ADK_SUPPRESS_EXPERIMENTAL_FEATURE_WARNINGS", "True")
+
+AGENTS_DIR = project_root / "agents"
+PORT = int(os.getenv("PORT", "8006"))
+# Optional model-readable artifact store (e.g. gs://bucket). When set and Vertex AI is the active backend,
+# uploaded diagrams are saved there once and the user message carries a fileData reference instead of
+# the inline base64 bytes. Unset, ADK keeps artifacts on local disk under agents/.adk/artifacts.
+ARTIFACT_SERVICE_URI = os.getenv("ARTIFACT_SERVICE_URI") or None
+SAVE_FILES_AS_ARTIFACTS_PLUGIN = "shared.plugins.vertex_artifacts.VertexSaveFilesAsArtifactsPlugin"
+# libuv event loop where available (uvloop has no Windows build); httptools parses HTTP in C
+UVICORN_LOOP = "uvloop" if sys.platform != "win32" else "asyncio"
+
+
+def add_set_api_key_route(app: FastAPI) -> None:
+    """Let the frontend server set API key / Vertex / model at runtime (ADK reads them from env)."""
+
+    @app.post("/set-api-key")
+    async def set_api_key(request: Request):
+        body = await request.json()
+        api_key = (body.get("api_key") or "").strip()
+        if api_key:
+            os.environ["GOOGLE_API_KEY"] = api_key
+        if body.get("use_vertex"):
+            os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
+            if body.get("vertex_project"):
+                os.environ["GOOGLE_CLOUD_PROJECT"] = body["vertex_project"]
+            if body.get("vertex_location"):
+                os.environ["GOOGLE_CLOUD_LOCATION"] = body["vertex_location"]
+        model_id = (body.get("model_id") or "").strip()
+        if model_id:
+            os.environ["GOOGLE_GENAI_MODEL"] = model_id
+        return {"ok": True}
+
+
+def make_agents_app(agents_dir: Path = AGENTS_DIR, port: int = PORT, a2a: bool = True) -> FastAPI:
+    """Build the ADK FastAPI app serving every agent under agents_dir."""
+    from google.adk.cli import fast_api
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    app = fast_api.get_fast_api_app(
+        agents_dir=str(agents_dir),
+        session_service_uri=None,
+        artifact_service_uri=ARTIFACT_SERVICE_URI,
+        memory_service_uri=None,
+        eval_storage_uri=None,
+        allow_origins=[],
+        web=False,
+        trace_to_cloud=False,
+        otel_to_cloud=False,
+        a2a=a2a,
+        host="0.0.0.0",
+        port=port,
+        url_prefix=None,
+        reload_agents=False,
+        # Only a gs:// store yields a URI the model can fetch, and only through Vertex AI (checked per
+        # message by the plugin, since /set-api-key can switch backends); otherwise images stay inline
+        extra_plugins=[SAVE_FILES_AS_ARTIFACTS_PLUGIN]
+        if ARTIFACT_SERVICE_URI and ARTIFACT_SERVICE_URI.startswith("gs://")
+        else None,
+    )
+    try:
+        from shared.tools.a2a_utils import a2a_card_middleware
+
+        app.add_middleware(BaseHTTPMiddleware, dispatch=a2a_card_middleware)
+    except ImportError:
+        pass
+    add_set_api_key_route(app)
+    return app
+
+
+def main():
+    """Serve all agents on a single port."""
+    import uvicorn
+
+    logger.info("Serving all agents from %s on http://localhost:%s", AGENTS_DIR, PORT)
+    uvicorn.run(make_agents_app(), host="0.0.0.0", port=PORT, loop=UVICORN_LOOP, http="httptools")
+
+
+if __name__ == "__main__":
+    main()
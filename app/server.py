@@ -11,19 +11,23 @@ import io
 import json
 import logging
 import os
+import re
 import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from PIL import Image
 from pydantic import BaseModel
 
 from shared.providers.registry import ProviderRegistry
+from shared.tools.pdf_worker import PDF_PENDING_PREFIX, PDF_READY_PREFIX, pdf_session_token
 from shared.utils.security_validator import validate_input_safety
 
 _registry = ProviderRegistry.instance()
@@ -36,6 +40,13 @@ if str(project_root) not in sys.path:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared pooled client for all orchestrator/agent calls so connections are reused across requests.
+# Closed in lifespan on shutdown.
+_http = httpx.AsyncClient(
+    timeout=httpx.Timeout(10.0, read=300.0),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+)
+
 
 def _user_friendly_error(raw_message: str, status_code: int | None = None) -> str:
     """Map internal/technical errors to short, user-friendly messages. No stack traces or URLs."""
@@ -62,6 +73,11 @@ def _user_friendly_error(raw_message: str, status_code: int | None = None) -> st
     return "Analysis failed. Please try again or choose a different model."
 
 
+def _sse_error(message: str) -> bytes:
+    """Encode an error as a single SSE data frame."""
+    return b"data: " + orjson.dumps({"error": message}) + b"\n\n"
+
+
 def _cleanup_old_files(dir_path: Path, max_age_seconds: float) -> int:
     """Delete files in dir_path older than max_age_seconds. Returns count deleted."""
     if not dir_path.exists() or not dir_path.is_dir():
@@ -88,6 +104,7 @@ def _run_cleanup() -> None:
     logs_max_sec = LOGS_MAX_AGE_DAYS * 86400
     n_uploads = _cleanup_old_files(UPLOAD_DIR, uploads_max_sec)
     n_reports = _cleanup_old_files(REPORTS_DIR, reports_max_sec)
+    n_reports += _cleanup_old_files(REPORTS_DIR / ".cache", reports_max_sec)
     n_logs = _cleanup_old_files(LOGS_DIR, logs_max_sec)
     if n_uploads or n_reports or n_logs:
         logger.info(
@@ -100,7 +117,7 @@ def _run_cleanup() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Start background cleanup task; cancel it on shutdown."""
+    """Start background cleanup task; cancel it and close the shared HTTP client on shutdown."""
     cleanup_task: asyncio.Task | None = None
 
     async def cleanup_loop() -> None:
@@ -129,20 +146,25 @@ async def lifespan(app: FastAPI):
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    await _http.aclose()
 
 
-app = FastAPI(title="AutoThreat AI", lifespan=lifespan)
+app = FastAPI(title="AutoThreat AI", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Explicit origin allowlist (comma-separated); blanks and surrounding spaces are dropped so entries match exactly
+ALLOWED_ORIGINS = [
+    origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:8000").split(",") if origin.strip()
+]
 
 # Enable CORS
 app.add_middleware(
     # ⚠️ Whitelist specific origins - don't use ["*"] for production
     CORSMiddleware,
-    allow_origins=os.getenv("ALLOWED_ORIGINS", "http://localhost:8000").split(","),  # Whitelist specific origins
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "DELETE"],
+    allow_methods=["GET", "POST", "DELETE"],  # DELETE is needed by /api/upload/{filename}
     allow_headers=["Content-Type", "Authorization"],
-    expose_headers=["*"],
-    max_age=3600,
+    max_age=86400,  # Browsers cache preflight results for a day
 )
 
 # File upload validation
@@ -157,6 +179,13 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 # Reports directory
 REPORTS_DIR = project_root / "reports"
 REPORTS_DIR.mkdir(exist_ok=True)
+# Downloadable report names, e.g. report_18a2b3c4d5e6f708.pdf
+REPORT_FILENAME_PATTERN = re.compile(r"report_[A-Za-z0-9_\-]{1,128}\.pdf")
+
+# Max time /api/reports/latest-pdf waits for an in-progress background PDF render
+PDF_PENDING_WAIT_SECONDS = 2.0
+# Pending-render markers older than this are left over from a dead PDF worker and are ignored
+PDF_PENDING_MAX_AGE_SECONDS = 300.0
 
 # Logs
 LOGS_DIR = project_root / "logs"
@@ -168,6 +197,11 @@ REPORTS_MAX_AGE_DAYS = int(os.getenv("REPORTS_MAX_AGE_DAYS", "7"))
 LOGS_MAX_AGE_DAYS = int(os.getenv("LOGS_MAX_AGE_DAYS", "30"))
 CLEANUP_INTERVAL_SECONDS = int(os.getenv("CLEANUP_INTERVAL_SECONDS", "3600"))  # 1 hour
 
+# Max orchestrator pipelines /api/batch_query runs at once, shared across all in-flight batches
+# (keeps model quota usage bounded)
+BATCH_CONCURRENCY = max(1, int(os.getenv("BATCH_CONCURRENCY", "4")))
+_batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
 # Orchestrator URL
 ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:8005")
 # Try different possible agent names (try directory name first as it's more reliable)
@@ -176,6 +210,11 @@ AGENT_NAME_ALT = "orchestrator"  # From directory name
 
 # Store working agent name
 WORKING_AGENT_NAME = AGENT_NAME
+# Seconds a discovered agent name is trusted before /list-apps is consulted again
+AGENT_NAME_TTL_SECONDS = 60.0
+_agent_name_expires_at = 0.0
+# Only one request runs discovery at a time; the others wait and reuse its result
+_agent_name_lock = asyncio.Lock()
 
 # Frontend: Svelte build (app/frontend-svelte/dist)
 frontend_svelte_dist = project_root / "app" / "frontend-svelte" / "dist"
@@ -220,76 +259,95 @@ async def serve_asset(filename: str):
     return FileResponse(str(file_path), media_type=media_type, headers=headers)
 
 
-@app.post("/api/sessions")
-async def create_session():
-    """Create a new session with the orchestrator."""
-    global WORKING_AGENT_NAME
-    user_id = "web_user"
+async def _create_session_first_success(agent_names: list[str], user_id: str) -> tuple[str, Any] | None:
+    """
+    Create a session on every candidate app concurrently.
+
+    Returns (agent_name, session) for the first 2xx response and cancels the remaining
+    probes, or None if every candidate failed.
+    """
 
+    async def attempt(agent_name: str) -> tuple[str, httpx.Response | None]:
+        url = f"{ORCHESTRATOR_URL}/apps/{agent_name}/users/{user_id}/sessions"
+        logger.info("Trying to create session at: %s", url)
+        try:
+            return agent_name, await _http.post(url, timeout=10.0)
+        except httpx.HTTPError as e:
+            logger.warning("Failed with agent name %s: %s", agent_name, e)
+            return agent_name, None
+
+    tasks = [asyncio.create_task(attempt(name)) for name in agent_names]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            agent_name, response = await next_done
+            if response is None:
+                continue
+            if response.status_code in (200, 201):
+                logger.info("Session created successfully with agent: %s", agent_name)
+                return agent_name, response.json()
+            error_text = response.text[:500] if response.text else str(response.status_code)
+            logger.warning("Failed with agent name %s: %s - %s", agent_name, response.status_code, error_text)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None
+
+
+async def _discover_and_create_session(user_id: str) -> tuple[str, Any] | None:
+    """Find the orchestrator app name via /list-apps (falling back to the known names) and create a session."""
     # First, try to get list of available apps to find the correct orchestrator name
     try:
-        async with httpx.AsyncClient() as client:
-            list_url = f"{ORCHESTRATOR_URL}/list-apps"
-            logger.info("Checking available apps at: %s", list_url)
-            list_response = await client.get(list_url, timeout=5.0)
-            if list_response.status_code == 200:
-                available_apps = list_response.json()
-                logger.info("Available apps: %s", available_apps)
-
-                # Try to find orchestrator app name (check common variations)
-                orchestrator_candidates = [
-                    "threat_model_orchestrator",
-                    "threat_modeller_orchestrator",
-                    "orchestrator",
-                    "threat_model_orchestrator_agent",
-                ]
-
-                for candidate in orchestrator_candidates:
-                    if candidate in available_apps:
-                        logger.info("Found orchestrator app: %s", candidate)
-                        WORKING_AGENT_NAME = candidate
-                        # Now create session with correct name
-                        url = f"{ORCHESTRATOR_URL}/apps/{candidate}/users/{user_id}/sessions"
-                        logger.info("Creating session at: %s", url)
-                        session_response = await client.post(url, timeout=10.0)
-                        if session_response.status_code in [200, 201]:
-                            result = session_response.json()
-                            logger.info("Session created successfully with agent: %s", candidate)
-                            return result
-                        else:
-                            error_text = (
-                                session_response.text[:500]
-                                if session_response.text
-                                else str(session_response.status_code)
-                            )
-                            logger.warning(
-                                "Failed to create session with %s: %s - %s",
-                                candidate,
-                                session_response.status_code,
-                                error_text,
-                            )
+        list_url = f"{ORCHESTRATOR_URL}/list-apps"
+        logger.info("Checking available apps at: %s", list_url)
+        list_response = await _http.get(list_url, timeout=5.0)
+        if list_response.status_code == 200:
+            available_apps = list_response.json()
+            logger.info("Available apps: %s", available_apps)
+
+            # Try to find orchestrator app name (check common variations)
+            orchestrator_candidates = [
+                "threat_model_orchestrator",
+                "threat_modeller_orchestrator",
+                "orchestrator",
+                "threat_model_orchestrator_agent",
+            ]
+            found = [candidate for candidate in orchestrator_candidates if candidate in available_apps]
+            if found:
+                logger.info("Found orchestrator app(s): %s", found)
+                created = await _create_session_first_success(found, user_id)
+                if created:
+                    return created
     except Exception as e:
         logger.warning("Could not list apps, trying direct connection: %s", e)
 
     # Fallback: Try both possible agent names directly
-    for agent_name in [AGENT_NAME, AGENT_NAME_ALT]:
-        url = f"{ORCHESTRATOR_URL}/apps/{agent_name}/users/{user_id}/sessions"
-        logger.info("Trying to create session at: %s", url)
+    return await _create_session_first_success([AGENT_NAME, AGENT_NAME_ALT], user_id)
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, timeout=10.0)
-                if response.status_code == 200 or response.status_code == 201:
-                    result = response.json()
-                    logger.info("Session created successfully with agent: %s", agent_name)
-                    WORKING_AGENT_NAME = agent_name
-                    return result
-                else:
-                    error_text = response.text[:500] if response.text else str(response.status_code)
-                    logger.warning("Failed with agent name %s: %s - %s", agent_name, response.status_code, error_text)
-        except httpx.HTTPError as e:
-            logger.warning("Failed with agent name %s: %s", agent_name, e)
-            continue
+
+@app.post("/api/sessions")
+async def create_session():
+    """Create a new session with the orchestrator."""
+    global WORKING_AGENT_NAME, _agent_name_expires_at
+    user_id = "web_user"
+
+    # Fast path: the app name was discovered recently, post straight to it
+    if time.monotonic() < _agent_name_expires_at:
+        created = await _create_session_first_success([WORKING_AGENT_NAME], user_id)
+        if created:
+            return created[1]
+        _agent_name_expires_at = 0.0
+
+    async with _agent_name_lock:
+        # Another request may have refreshed the name while this one waited on the lock
+        created = None
+        if time.monotonic() < _agent_name_expires_at:
+            created = await _create_session_first_success([WORKING_AGENT_NAME], user_id)
+        if not created:
+            created = await _discover_and_create_session(user_id)
+        if created:
+            WORKING_AGENT_NAME, result = created
+            _agent_name_expires_at = time.monotonic() + AGENT_NAME_TTL_SECONDS
+            return result
 
     # If we get here, both attempts failed
     raise HTTPException(
@@ -391,52 +449,51 @@ async def stream_query(request: QueryRequest):
     orch_url = f"{base}:8006/set-api-key"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as set_client:
-            for port, agent_id in agent_port_map.items():
-                set_key_url = f"{base}:{port}/set-api-key"
+        for port, agent_id in agent_port_map.items():
+            set_key_url = f"{base}:{port}/set-api-key"
 
-                # Start with global payload
-                agent_payload = request_payload_creds.copy()
+            # Start with global payload
+            agent_payload = request_payload_creds.copy()
 
-                # Merge in agent-specific overrides if present
-                agent_config = _registry.get_config_for_agent(agent_id)
-                if agent_config:
-                    if "api_key" not in agent_payload and agent_config.api_key:
-                        agent_payload["api_key"] = agent_config.api_key
-                    if "model_id" not in agent_payload and agent_config.default_model:
-                        agent_payload["model_id"] = agent_config.default_model
+            # Merge in agent-specific overrides if present
+            agent_config = _registry.get_config_for_agent(agent_id)
+            if agent_config:
+                if "api_key" not in agent_payload and agent_config.api_key:
+                    agent_payload["api_key"] = agent_config.api_key
+                if "model_id" not in agent_payload and agent_config.default_model:
+                    agent_payload["model_id"] = agent_config.default_model
 
-                # Only send if there is something to send
-                if not agent_payload:
-                    continue
+            # Only send if there is something to send
+            if not agent_payload:
+                continue
 
-                try:
-                    r = await set_client.post(set_key_url, json=agent_payload)
-                    if r.status_code == 200:
-                        logger.info("set-api-key succeeded: %s with config from %s", set_key_url, agent_id)
-                    else:
-                        if set_key_url == orch_url:
-                            logger.error("set-api-key orchestrator failed: %s %s", r.status_code, r.text[:300])
-                            raise HTTPException(
-                                status_code=503,
-                                detail=(
-                                    "Orchestrator could not accept API key. "
-                                    "If using Docker, rebuild the orchestrator: docker compose build orchestrator"
-                                ),
-                            )
-                        logger.warning("set-api-key %s returned %s", set_key_url, r.status_code)
-                except HTTPException:
-                    raise
-                except Exception as e:
+            try:
+                r = await _http.post(set_key_url, json=agent_payload, timeout=10.0)
+                if r.status_code == 200:
+                    logger.info("set-api-key succeeded: %s with config from %s", set_key_url, agent_id)
+                else:
                     if set_key_url == orch_url:
+                        logger.error("set-api-key orchestrator failed: %s %s", r.status_code, r.text[:300])
                         raise HTTPException(
                             status_code=503,
                             detail=(
-                                f"Cannot set API key on orchestrator: {e!s}. "
-                                "If using Docker, ensure orchestrator is running and rebuilt."
+                                "Orchestrator could not accept API key. "
+                                "If using Docker, rebuild the orchestrator: docker compose build orchestrator"
                             ),
-                        ) from e
-                    logger.debug("set-api-key %s failed: %s", set_key_url, e)
+                        )
+                    logger.warning("set-api-key %s returned %s", set_key_url, r.status_code)
+            except HTTPException:
+                raise
+            except Exception as e:
+                if set_key_url == orch_url:
+                    raise HTTPException(
+                        status_code=503,
+                        detail=(
+                            f"Cannot set API key on orchestrator: {e!s}. "
+                            "If using Docker, ensure orchestrator is running and rebuilt."
+                        ),
+                    ) from e
+                logger.debug("set-api-key %s failed: %s", set_key_url, e)
     except HTTPException:
         raise
     except Exception as e:
@@ -446,7 +503,6 @@ async def stream_query(request: QueryRequest):
             detail=f"Cannot set API key on orchestrator: {e!s}. If using Docker, ensure orchestrator is running and rebuilt.",
         ) from e
 
-    client = httpx.AsyncClient(timeout=300.0)
     try:
         # Stream the response - keep connection alive
         async def generate():
@@ -483,11 +539,12 @@ async def stream_query(request: QueryRequest):
                     },
                 )
 
-                async with client.stream(
+                async with _http.stream(
                     "POST",
                     url,
-                    json=request_payload,
-                    headers={"Content-Type": "application/json"},
+                    content=orjson.dumps(request_payload),
+                    # Ask for an uncompressed stream: the bytes are piped through untouched
+                    headers={"Content-Type": "application/json", "Accept-Encoding": "identity"},
                 ) as response:
                     logger.info("Response status: %s", response.status_code)
                     logger.info("Response headers: %s", dict(response.headers))
@@ -496,12 +553,9 @@ async def stream_query(request: QueryRequest):
                         # Read error response
                         error_text = f"HTTP {response.status_code}"
                         try:
-                            # Read error body from stream
-                            error_chunks = []
-                            async for chunk in response.aiter_bytes():
-                                error_chunks.append(chunk)
-                            if error_chunks:
-                                error_body = b"".join(error_chunks)
+                            # Streamed responses must be read before .text is available
+                            error_body = await response.aread()
+                            if error_body:
                                 error_text = error_body.decode("utf-8", errors="replace")
                         except Exception as e:
                             logger.warning("Could not read error body: %s", e)
@@ -509,30 +563,24 @@ async def stream_query(request: QueryRequest):
                         logger.error("Query failed with status %s: %s", response.status_code, error_text[:200])
                         logger.error("Request URL was: %s", url)
                         friendly = _user_friendly_error(error_text, response.status_code)
-                        yield f"data: {json.dumps({'error': friendly})}\n\n"
+                        yield _sse_error(friendly)
                         return
 
-                    # Stream the response chunks - small chunk_size so browser gets updates as each SSE event is sent
+                    # Forward raw bytes as they arrive (no chunk_size) so the browser gets each SSE event
+                    # at the upstream frame boundaries; aiter_raw skips httpx's content decoder since
+                    # the upstream was asked for identity encoding
                     try:
-                        async for chunk in response.aiter_bytes(chunk_size=256):
+                        async for chunk in response.aiter_raw():
                             if chunk:
-                                # Decode and yield immediately - no buffering
-                                try:
-                                    decoded = chunk.decode("utf-8", errors="replace")
-                                    yield decoded
-                                except UnicodeDecodeError:
-                                    # Skip invalid UTF-8 sequences
-                                    pass
+                                yield chunk
                     except Exception as e:
                         logger.error("Error reading stream: %s", e, exc_info=True)
                         friendly = _user_friendly_error(str(e))
-                        yield f"data: {json.dumps({'error': friendly})}\n\n"
+                        yield _sse_error(friendly)
             except Exception as e:
                 logger.error("Error in stream generation: %s", e, exc_info=True)
                 friendly = _user_friendly_error(str(e))
-                yield f"data: {json.dumps({'error': friendly})}\n\n"
-            finally:
-                await client.aclose()
+                yield _sse_error(friendly)
 
         return StreamingResponse(
             generate(),
@@ -562,6 +610,62 @@ async def stream_query(request: QueryRequest):
         raise HTTPException(status_code=500, detail=friendly) from e
 
 
+# QueryRequest fields that must be identical across a batch (see batch_query)
+BATCH_SHARED_FIELDS = ("provider_id", "model_id", "api_key", "use_vertex", "vertex_project", "vertex_location")
+
+
+async def _stream_single(request: QueryRequest) -> dict[str, Any]:
+    """Run one query through stream_query and collect its SSE events into a single JSON result."""
+    async with _batch_semaphore:
+        response = await stream_query(request)
+        events: list[Any] = []
+        buffer = b""
+        async for chunk in response.body_iterator:
+            buffer += chunk if isinstance(chunk, bytes) else chunk.encode()
+            *frames, buffer = buffer.split(b"\n\n")
+            for frame in frames:
+                for line in frame.splitlines():
+                    if line.startswith(b"data:"):
+                        events.append(orjson.loads(line[5:]))
+
+    error = next((e["error"] for e in events if isinstance(e, dict) and "error" in e), None)
+    result: dict[str, Any] = {"session_id": request.session_id, "events": events}
+    if error:
+        result["error"] = error
+    return result
+
+
+@app.post("/api/batch_query")
+async def batch_query(requests: list[QueryRequest]):
+    """Run several queries (one per session) through the orchestrator concurrently."""
+    if not requests:
+        raise HTTPException(status_code=400, detail="At least one query is required")
+    session_ids = [r.session_id for r in requests]
+    if len(set(session_ids)) != len(session_ids):
+        # Concurrent runs on one session would interleave their state
+        raise HTTPException(status_code=400, detail="Each query in a batch needs its own session_id")
+    # Credentials and model are pushed into the agents' process-wide environment per query, so
+    # concurrent queries with different settings would overwrite each other mid-pipeline
+    if len({tuple(getattr(r, field) for field in BATCH_SHARED_FIELDS) for r in requests}) != 1:
+        raise HTTPException(
+            status_code=400, detail="All queries in a batch must use the same provider, model and credentials"
+        )
+
+    logger.info("Batch query: %d requests (concurrency %d)", len(requests), BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(_stream_single(r) for r in requests), return_exceptions=True)
+
+    batch: list[dict[str, Any]] = []
+    for request, result in zip(requests, results, strict=True):
+        if isinstance(result, HTTPException):
+            batch.append({"session_id": request.session_id, "events": [], "error": result.detail})
+        elif isinstance(result, BaseException):
+            logger.error("Batch query failed for session %s: %s", request.session_id, result)
+            batch.append({"session_id": request.session_id, "events": [], "error": _user_friendly_error(str(result))})
+        else:
+            batch.append(result)
+    return {"results": batch}
+
+
 @app.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
     """
@@ -933,23 +1037,81 @@ async def update_provider_config(update: ProviderConfigUpdate):
     return {"providers": refreshed, "default_provider": data.get("default_provider")}
 
 
+def _pdf_render_pending(reports_dir: Path, token: str | None = None) -> bool:
+    """
+    True while a recent pending-render marker exists: the given session token's, or any session's when
+    token is None. Stale markers from a dead worker are ignored.
+    """
+    cutoff = time.time() - PDF_PENDING_MAX_AGE_SECONDS
+    prefix = PDF_PENDING_PREFIX + (token or "")
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix):
+                try:
+                    if entry.stat().st_mtime >= cutoff:
+                        return True
+                except FileNotFoundError:
+                    pass  # Render finished while scanning
+    return False
+
+
+def _session_pdf_name(reports_dir: Path, token: str) -> str | None:
+    """Filename of the PDF rendered for a session (from its ready file), if it is still on disk."""
+    try:
+        filename = (reports_dir / (PDF_READY_PREFIX + token)).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not REPORT_FILENAME_PATTERN.fullmatch(filename) or not (reports_dir / filename).is_file():
+        return None
+    return filename
+
+
 @app.get("/api/reports/latest-pdf")
-async def get_latest_pdf():
-    """Get the latest PDF report file."""
+async def get_latest_pdf(session_id: str | None = None):
+    """
+    Get the latest PDF report file, or the one rendered for session_id when given.
+
+    Returns 202 {"status": "pending"} while that PDF is still being rendered in the background.
+    """
     reports_dir = project_root / "reports"
     if not reports_dir.exists():
         raise HTTPException(status_code=404, detail="Reports directory not found")
 
-    # Find all PDF files
-    pdf_files = list(reports_dir.glob("report_*.pdf"))
-    if not pdf_files:
-        raise HTTPException(status_code=404, detail="No PDF reports found")
+    # The report builder renders the final PDF in the background and keeps a
+    # reports/.pdf_pending_<token> marker while it runs; give it a moment to finish.
+    token = pdf_session_token(session_id) if session_id else None
+    deadline = time.monotonic() + PDF_PENDING_WAIT_SECONDS
+    while _pdf_render_pending(reports_dir, token):
+        if time.monotonic() >= deadline:
+            # Still rendering: the newest PDF on disk would be the previous report's
+            return JSONResponse(
+                {"status": "pending", "detail": "The PDF report is still being generated"}, status_code=202
+            )
+        await asyncio.sleep(0.1)
+
+    if token:
+        filename = _session_pdf_name(reports_dir, token)
+        if filename is None:
+            raise HTTPException(status_code=404, detail="No PDF report found for this session")
+        pdf_path = reports_dir / filename
+        return {
+            "file_path": str(pdf_path.relative_to(project_root)),
+            "filename": filename,
+            "created": pdf_path.stat().st_mtime,
+        }
 
-    # Get the most recent PDF
-    latest_pdf = max(pdf_files, key=lambda p: p.stat().st_mtime)
+    # Most recent PDF; DirEntry caches its stat() result so each file is stat'ed once
+    with os.scandir(reports_dir) as entries:
+        latest_pdf = max(
+            (e for e in entries if e.name.startswith("report_") and e.name.endswith(".pdf")),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    if latest_pdf is None:
+        raise HTTPException(status_code=404, detail="No PDF reports found")
 
     return {
-        "file_path": str(latest_pdf.relative_to(project_root)),
+        "file_path": str((reports_dir / latest_pdf.name).relative_to(project_root)),
         "filename": latest_pdf.name,
         "created": latest_pdf.stat().st_mtime,
     }
@@ -958,26 +1120,33 @@ async def get_latest_pdf():
 @app.get("/api/reports/download/{filename}")
 async def download_report(filename: str):
     """Download a report file."""
-    # Security: Only allow PDF files from reports directory
-    if not filename.endswith(".pdf") or not filename.startswith("report_"):
+    # Security: Only allow generated report PDFs (no separators, dots or other path syntax)
+    if not REPORT_FILENAME_PATTERN.fullmatch(filename):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     # Normalize path and ensure it's within reports directory
-    file_path = (project_root / "reports" / filename).resolve()
-    reports_dir = (project_root / "reports").resolve()
+    file_path = os.path.realpath(REPORTS_DIR / filename)
+    reports_dir = os.path.realpath(REPORTS_DIR)
 
-    # Prevent path traversal
-    if not str(file_path).startswith(str(reports_dir)):
+    # Prevent path traversal (including via symlinks)
+    if not file_path.startswith(reports_dir + os.sep):
         raise HTTPException(status_code=403, detail="Access denied")
 
-    if not file_path.exists():
+    if not os.path.isfile(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(path=str(file_path), filename=filename, media_type="application/pdf")
+    return FileResponse(path=file_path, filename=filename, media_type="application/pdf")
 
 
 if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # libuv event loop and C HTTP parser (uvloop is not available on Windows)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+    )
@@ -12,11 +12,13 @@ Usage:
 """
 
 import logging
+import multiprocessing
 import os
 import signal
 import subprocess
 import sys
 import time
+from multiprocessing.process import BaseProcess
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -73,8 +75,13 @@ AGENTS = [
     },
 ]
 
-# Store process IDs
-processes: list[subprocess.Popen] = []
+# Store started processes (forked agents and the FastAPI app subprocess)
+processes: list[subprocess.Popen | BaseProcess] = []
+
+
+def exit_code(process: subprocess.Popen | BaseProcess) -> int | None:
+    """Exit code of a started process, or None while it is still running."""
+    return process.poll() if isinstance(process, subprocess.Popen) else process.exitcode
 
 
 def kill_existing_processes():
@@ -121,133 +128,66 @@ def kill_existing_processes():
         logger.warning("Error cleaning up ports: %s", e)
 
 
-def start_agent(agent_config: dict) -> subprocess.Popen | None:
-    """Start a single agent as an ADK server."""
-    agent_dir = project_root / agent_config["dir"]
-    port = agent_config["port"]
-    name = agent_config["name"]
+def preload_agent_runtime() -> None:
+    """
+    Import the heavy agent-serving modules once in the parent.
 
-    if not agent_dir.exists():
-        logger.error("Agent directory not found: %s", agent_dir)
-        return None
+    Agents are started with fork(), so every child inherits these already-imported modules
+    (copy-on-write) instead of paying the ADK / genai / pydantic import cost again.
+    """
+    import google.adk.cli.fast_api  # noqa: F401
+    import google.genai  # noqa: F401
+    import httpx  # noqa: F401
+    import pydantic  # noqa: F401
+    import uvicorn  # noqa: F401
 
-    logger.info("Starting %s on port %s...", name, port)
+    import app.serve_all  # noqa: F401
 
-    # Build the command using ADK's fast_api to create an app for this single agent
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(project_root)
-    env["ADK_SUPPRESS_EXPERIMENTAL_FEATURE_WARNINGS"] = "True"
-    # Suppress OpenTelemetry warnings about None attribute values
-    env["OTEL_SDK_DISABLED"] = "false"  # Keep OTEL enabled but suppress warnings
 
-    # Determine the agent name from the directory
-    agent_name = agent_dir.name
+def _serve_agent(agent_dir: Path, port: int, log_file: Path) -> None:
+    """Child-process entry point: serve the agents directory on one port, logging to log_file."""
+    # The parent's shutdown handler must not run in the children
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(fd, sys.stdout.fileno())
+    os.dup2(fd, sys.stderr.fileno())
+    os.close(fd)
 
-    # Create a wrapper module that uses ADK's fast_api to create a FastAPI app
-    # We use uvicorn to run the wrapper module which creates the app
-    wrapper_module_content = f'''"""
-Temporary wrapper module to start a single ADK agent as a FastAPI app.
-This file is auto-generated by run_local.py
-"""
-import sys
-import logging
-from pathlib import Path
+    import uvicorn
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+    from app.serve_all import make_agents_app
 
-# Suppress OpenTelemetry attribute warnings for None values
-logging.getLogger("opentelemetry.attributes").setLevel(logging.ERROR)
-# Suppress google_genai "non-text parts (function_call)" warning; ADK handles tool calls.
-logging.getLogger("google_genai.types").setLevel(logging.ERROR)
-
-from google.adk.cli import fast_api
-from starlette.middleware.base import BaseHTTPMiddleware
-
-# Create FastAPI app for the agent
-# fast_api.get_fast_api_app expects agents_dir to contain agent subdirectories
-# So we pass the parent directory (agents/) and it will discover all agents
-# The port parameter controls which port the server runs on
-agents_parent = Path(r"{agent_dir.parent}")
-
-app = fast_api.get_fast_api_app(
-    agents_dir=str(agents_parent),
-    session_service_uri=None,
-    artifact_service_uri=None,
-    memory_service_uri=None,
-    eval_storage_uri=None,
-    allow_origins=[],
-    web=False,
-    trace_to_cloud=False,
-    otel_to_cloud=False,
-    a2a=True,
-    host="0.0.0.0",
-    port={port},
-    url_prefix=None,
-    reload_agents=False,
-    extra_plugins=None,
-)
-
-# Add A2A middleware if available
-try:
-    from shared.tools.a2a_utils import a2a_card_middleware
-    app.add_middleware(BaseHTTPMiddleware, dispatch=a2a_card_middleware)
-except ImportError:
-    pass
-'''
-
-    # All agents: add set-api-key so server can set API key / Vertex / model (ADK uses env)
-    set_api_key_extra = """
-# Allow server to set API key / Vertex / model from frontend (ADK uses env)
-import os
-from fastapi import Request
-@app.post("/set-api-key")
-async def set_api_key(request: Request):
-    body = await request.json()
-    api_key = (body.get("api_key") or "").strip()
-    if api_key:
-        os.environ["GOOGLE_API_KEY"] = api_key
-    if body.get("use_vertex"):
-        os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
-        if body.get("vertex_project"):
-            os.environ["GOOGLE_CLOUD_PROJECT"] = body["vertex_project"]
-        if body.get("vertex_location"):
-            os.environ["GOOGLE_CLOUD_LOCATION"] = body["vertex_location"]
-    model_id = (body.get("model_id") or "").strip()
-    if model_id:
-        os.environ["GOOGLE_GENAI_MODEL"] = model_id
-    return {"ok": True}
-"""
-    wrapper_module_content = wrapper_module_content.rstrip() + set_api_key_extra + "\n"
+    uvicorn.run(make_agents_app(agents_dir=agent_dir.parent, port=port, a2a=True), host="0.0.0.0", port=port)
 
-    # Write the wrapper module to a temp file
-    wrapper_file = project_root / "app" / f"_agent_wrapper_{agent_name}.py"
-    wrapper_file.write_text(wrapper_module_content)
 
-    cmd = ["uv", "run", "uvicorn", f"app._agent_wrapper_{agent_name}:app", "--host", "0.0.0.0", "--port", str(port)]
+def start_agent(agent_config: dict) -> BaseProcess | None:
+    """Start a single agent as an ADK server in a forked child process."""
+    agent_dir = project_root / agent_config["dir"]
+    port = agent_config["port"]
+    name = agent_config["name"]
+
+    if not agent_dir.exists():
+        logger.error("Agent directory not found: %s", agent_dir)
+        return None
+
+    logger.info("Starting %s on port %s...", name, port)
 
     try:
-        # Start the process - don't capture output so we can see errors in real-time
         # Use a log file for each agent to capture output
         log_file = project_root / "logs" / f"{name.lower().replace(' ', '_')}.log"
         log_file.parent.mkdir(exist_ok=True)
 
-        with open(log_file, "w", encoding="utf-8") as f:
-            process = subprocess.Popen(
-                cmd,
-                cwd=str(project_root),  # Run from project root for proper imports
-                stdout=f,
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                env=env,
-            )
+        process = multiprocessing.get_context("fork").Process(
+            target=_serve_agent, args=(agent_dir, port, log_file), name=name, daemon=False
+        )
+        process.start()
 
         # Check if process started successfully - wait a bit longer for startup
         time.sleep(2)  # Wait for process to start and potentially fail
-        if process.poll() is not None:
+        if process.exitcode is not None:
             # Process exited - likely an error
-            logger.error("Failed to start %s. Exit code: %s", name, process.returncode)
+            logger.error("Failed to start %s. Exit code: %s", name, process.exitcode)
             # Read the log file to show the error
             try:
                 with open(log_file, encoding="utf-8") as f:
@@ -264,7 +204,7 @@ async def set_api_key(request: Request):
         logger.info("%s started with PID %s (logs: %s)", name, process.pid, log_file)
         return process
 
-    except (OSError, subprocess.SubprocessError, ValueError) as e:
+    except (OSError, ValueError) as e:
         logger.error("Failed to start %s: %s", name, e)
         return None
 
@@ -503,6 +443,8 @@ def main():
     logger.info("Starting all agents...")
     logger.info("=" * 60)
 
+    preload_agent_runtime()
+
     for agent_config in AGENTS:
         process = start_agent(agent_config)
         if process:
@@ -566,10 +508,11 @@ def main():
         while True:
             # Check if any process has died
             for i, process in enumerate(processes):
-                if process.poll() is not None:
+                code = exit_code(process)
+                if code is not None:
                     # Process has exited
                     agent_name = AGENTS[i]["name"] if i < len(AGENTS) else "FastAPI App"
-                    logger.error("%s (process %s) has exited with code %s", agent_name, i, process.returncode)
+                    logger.error("%s (process %s) has exited with code %s", agent_name, i, code)
 
                     # Try to read the log file for more details
                     if i < len(AGENTS):
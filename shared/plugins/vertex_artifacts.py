@@ -0,0 +1,30 @@
+"""ADK plugin: save uploaded files as artifacts only while Vertex AI is the active model backend."""
+
+import os
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.plugins.save_files_as_artifacts_plugin import SaveFilesAsArtifactsPlugin
+from google.genai import types
+
+
+def vertex_ai_enabled() -> bool:
+    """True when google-genai routes model calls to Vertex AI (same env switch and parsing as the SDK)."""
+    return os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "").lower() in ("true", "1")
+
+
+class VertexSaveFilesAsArtifactsPlugin(SaveFilesAsArtifactsPlugin):
+    """
+    SaveFilesAsArtifactsPlugin that only swaps inline uploads for gs:// fileData references while
+    Vertex AI is the backend.
+
+    A model can only fetch a private gs:// object through Vertex AI (with bucket IAM); the API-key
+    Gemini endpoint cannot, so on that path the upload is left inline. The backend can change at
+    runtime via /set-api-key, hence the check per message rather than at startup.
+    """
+
+    async def on_user_message_callback(
+        self, *, invocation_context: InvocationContext, user_message: types.Content
+    ) -> types.Content | None:
+        if not vertex_ai_enabled():
+            return None
+        return await super().on_user_message_callback(invocation_context=invocation_context, user_message=user_message)
@@ -1,10 +1,59 @@
 """File Writer Tool"""
 
-import datetime
+import asyncio
+import functools
+import hashlib
+import io
 import logging
+import multiprocessing
 import os
-
-from markdown_pdf import MarkdownPdf, Section
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pymupdf
+from markdown_it import MarkdownIt
+
+logger = logging.getLogger(__name__)
+
+# Rendered PDFs keyed by a BLAKE2b digest of their markdown, so re-converting identical content is a file copy
+PDF_CACHE_DIR = "reports/.cache"
+# Create reports/ (and the PDF cache) once at import instead of probing on every write
+os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+
+# Report paths are REPORT_PATH_PREFIX + 16 hex digits of time.time_ns() + suffix
+REPORT_PATH_PREFIX = "reports/report_"
+MD_SUFFIX = ".md"
+PDF_SUFFIX = ".pdf"
+_PDF_CACHE_PREFIX = PDF_CACHE_DIR + "/"
+
+# Reports are written in chunks of at least this many bytes, rounded up to the filesystem block size
+WRITE_CHUNK_MIN = 128 * 1024
+# Flush file data (not metadata) before returning; macOS has no fdatasync
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# Markdown parser shared by every conversion: CommonMark plus GFM tables
+_MARKDOWN = MarkdownIt("commonmark").enable("table")
+_PAGE_RECT = pymupdf.paper_rect("A4")
+_CONTENT_RECT = _PAGE_RECT + (36, 36, -36, -36)  # Half-inch margins
+# Relative <img> sources (e.g. reports/threat_map_*.png from mermaid_to_png) resolve against the project root
+_IMAGE_ARCHIVE = pymupdf.Archive(str(Path(__file__).resolve().parent.parent.parent))
+# Rendered HTML that needs the outline/link pass: an <h1> or a link that is not an in-document anchor
+_NEEDS_POST_PASS_PATTERN = re.compile(r'<h1[ >]|<a href="(?!#)')
+
+# Tiny document touching both render paths (plain, and outline + external link) for warm_up_pdf_renderer
+_WARM_UP_MARKDOWN = "# Warm-up\n\nText with a [link](https://example.com).\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+
+
+@functools.cache
+def _write_chunk_size(directory: str) -> int:
+    """Bytes per write(2): WRITE_CHUNK_MIN rounded up to a multiple of the directory's filesystem block size."""
+    if not hasattr(os, "statvfs"):
+        return WRITE_CHUNK_MIN
+    bsize = os.statvfs(directory).f_bsize or 4096
+    return -(-WRITE_CHUNK_MIN // bsize) * bsize
 
 
 def write_file(content: str) -> dict:
@@ -19,29 +68,108 @@ def write_file(content: str) -> dict:
     """
     file_path = "N/A"
     try:
-        # Create a timestamp for the file name
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = f"reports/report_{timestamp}.md"
+        # Nanosecond timestamp in hex: sorts by creation time and never collides within a second
+        file_path = f"{REPORT_PATH_PREFIX}{time.time_ns():016x}{MD_SUFFIX}"
+
+        # Encode once and write block-aligned slices of it (a single write(2) for typical report sizes),
+        # then make the data durable before a downstream tool reads the file
+        data = memoryview(content.encode("utf-8"))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(file_path, flags, 0o644)
+        except FileNotFoundError:
+            # reports/ was removed (or the working directory changed) since import
+            os.makedirs("reports", exist_ok=True)
+            fd = os.open(file_path, flags, 0o644)
+        try:
+            chunk = _write_chunk_size("reports")
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written : written + chunk])
+            _datasync(fd)
+        finally:
+            os.close(fd)
+
+        logger.info("Successfully saved file: %s", file_path)
+        return {"status": "success", "file_path": file_path}
+    except (OSError, TypeError, ValueError) as e:
+        err = str(e)
+        logger.error("Error writing file %s: %s", file_path, err)
+        return {"status": "error", "error": err}
 
-        directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+def _render_pdf(content: str, file_path: str | io.BytesIO) -> None:
+    """
+    Lay out markdown as an A4 PDF: one markdown-it pass into a single PyMuPDF Story.
 
-        logging.info("Successfully saved file: %s", file_path)
-        return {"status": "success", "file_path": file_path}
-    except (OSError, TypeError, ValueError) as e:
-        logging.error("Error writing file %s: %s", file_path, e)
-        return {"status": "error", "error": str(e)}
+    Only external links and level-1 headings (the PDF outline) are recorded while placing the story;
+    in-document anchors are left as plain text since CommonMark headings carry no ids to point at.
+    Documents with neither are written straight to file_path, skipping position recording and the
+    re-open/save pass entirely.
+    """
+    html = _MARKDOWN.render(content)
+    story = pymupdf.Story(html=html, archive=_IMAGE_ARCHIVE)
+    if not _NEEDS_POST_PASS_PATTERN.search(html):
+        writer = pymupdf.DocumentWriter(file_path)
+        more = True
+        while more:
+            device = writer.begin_page(_PAGE_RECT)
+            more, _ = story.place(_CONTENT_RECT)
+            story.draw(device)
+            writer.end_page()
+        writer.close()
+        return
+
+    buffer = io.BytesIO()
+    writer = pymupdf.DocumentWriter(buffer)
+    links: list = []
+    toc: list[list] = []
+    page_num = 0
+
+    def record(position) -> None:
+        if not position.open_close & 1:  # Only element openings carry the info we need
+            return
+        if position.href and not position.href.startswith("#"):
+            position.page_num = page_num
+            links.append(position)
+        elif position.heading == 1:
+            toc.append([1, position.text, page_num, position.rect[1]])
+
+    more = True
+    while more:
+        page_num += 1
+        device = writer.begin_page(_PAGE_RECT)
+        more, _ = story.place(_CONTENT_RECT)
+        story.element_positions(record)
+        story.draw(device)
+        writer.end_page()
+    writer.close()
+
+    doc = pymupdf.Story.add_pdf_links(buffer, links)
+    try:
+        doc.set_toc(toc)
+        doc.save(file_path)
+    finally:
+        doc.close()
+
+
+def warm_up_pdf_renderer() -> None:
+    """
+    Render a throwaway document in memory so the first real report in this process does not pay
+    for markdown-it rule compilation or MuPDF's font and CSS setup. Failures are logged, not raised.
+    """
+    try:
+        _render_pdf(_WARM_UP_MARKDOWN, io.BytesIO())
+    except Exception as e:
+        logger.warning("PDF renderer warm-up failed: %s", e)
 
 
 def convert_markdown_to_pdf(content: str) -> dict:
     """
     Converts markdown text into a PDF file on the local filesystem.
 
-    Optimized for performance by using minimal TOC and faster rendering options.
+    Rendered directly with markdown-it-py and PyMuPDF (level-1 outline only). Content that was
+    already rendered is copied from the PDF cache instead of being laid out again.
 
     Args:
         content: The markdown text content to convert and save as PDF.
@@ -51,21 +179,47 @@ def convert_markdown_to_pdf(content: str) -> dict:
     """
     file_path = "N/A"
     try:
-        # Create a timestamp for the file name
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = f"reports/report_{timestamp}.pdf"
-
-        # Optimize PDF generation: use minimal TOC (level 1 only) for faster processing
-        # and disable unnecessary features that slow down rendering
-        pdf = MarkdownPdf(toc_level=1)  # Reduced from 2 to 1 for faster processing
-        pdf.add_section(Section(content))
-
-        # Save with optimized settings
-        logging.info("Starting PDF conversion for %s...", file_path)
-        pdf.save(file_path)
-        logging.info("Successfully saved PDF: %s", file_path)
+        # Nanosecond timestamp in hex: sorts by creation time and never collides within a second
+        file_path = f"{REPORT_PATH_PREFIX}{time.time_ns():016x}{PDF_SUFFIX}"
+
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        cached_path = _PDF_CACHE_PREFIX + digest + PDF_SUFFIX
+        if os.path.exists(cached_path):
+            shutil.copyfile(cached_path, file_path)
+            os.utime(cached_path)  # Keep frequently reused entries from aging out of the reports cleanup
+            logger.info("Reused cached PDF for %s", file_path)
+            return {"status": "success", "file_path": file_path}
+
+        # Render into the cache first (atomic rename) and copy out
+        logger.info("Starting PDF conversion for %s...", file_path)
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cached_path}.{os.getpid()}.tmp"
+        _render_pdf(content, tmp_path)
+        os.replace(tmp_path, cached_path)
+        shutil.copyfile(cached_path, file_path)
+        logger.info("Successfully saved PDF: %s", file_path)
 
         return {"status": "success", "file_path": file_path}
     except (OSError, TypeError, ValueError) as e:
-        logging.error("Error writing PDF %s: %s", file_path, e)
-        return {"status": "error", "error": str(e)}
+        err = str(e)
+        logger.error("Error writing PDF %s: %s", file_path, err)
+        return {"status": "error", "error": err}
+
+
+# Processes for convert_markdown_to_pdf_async (started on first use); PDF layout is CPU-bound Python
+_PDF_POOL = ProcessPoolExecutor(
+    max_workers=2, mp_context=multiprocessing.get_context("spawn"), initializer=warm_up_pdf_renderer
+)
+
+
+async def convert_markdown_to_pdf_async(content: str) -> dict:
+    """
+    Async variant of convert_markdown_to_pdf that renders in a separate process.
+
+    Args:
+        content: The markdown text content to convert and save as PDF.
+
+    Returns:
+        The same dictionary as convert_markdown_to_pdf.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_PDF_POOL, convert_markdown_to_pdf, content)
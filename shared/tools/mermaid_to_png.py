@@ -170,10 +170,11 @@ def mermaid_to_png(mermaid_diagram: str, output_filename: str | None = None) ->
                 pass
         return {"status": "error", "error": "Mermaid conversion timed out."}
     except Exception as e:
-        logging.error("mermaid_to_png failed: %s", e)
+        err = str(e)
+        logging.error("mermaid_to_png failed: %s", err)
         if temp_mmd and temp_mmd.exists():
             try:
                 temp_mmd.unlink(missing_ok=True)
             except OSError:
                 pass
-        return {"status": "error", "error": str(e)}
+        return {"status": "error", "error": err}
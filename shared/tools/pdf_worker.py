@@ -0,0 +1,98 @@
+"""
+PDF Worker
+
+A single long-lived process that renders Markdown reports to PDF from a queue, so the
+markdown-it / PyMuPDF import and setup cost is paid once rather than per report, and
+rendering never competes with the agent event loop for the GIL.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from multiprocessing.queues import Queue
+
+logger = logging.getLogger(__name__)
+
+# Marker files named reports/<PDF_PENDING_PREFIX><token> exist while a session's render is in progress;
+# once it succeeds, reports/<PDF_READY_PREFIX><token> holds the rendered PDF's filename
+PDF_PENDING_PREFIX = ".pdf_pending_"
+PDF_READY_PREFIX = ".pdf_ready_"
+
+_lock = threading.Lock()
+_queue = None
+_process = None
+
+
+def pdf_session_token(session_id: str) -> str:
+    """Filename-safe token for a session id, used to name its PDF pending/ready files."""
+    return hashlib.blake2b(session_id.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _worker_main(queue) -> None:
+    """Worker loop: warm up the renderer, then render (content, marker_path, ready_path) jobs until a None sentinel arrives."""
+    from shared.tools.file_writer_tool import convert_markdown_to_pdf, warm_up_pdf_renderer
+
+    warm_up_pdf_renderer()
+    while True:
+        job = queue.get()
+        if job is None:
+            return
+        content, marker_path, ready_path = job
+        try:
+            result = convert_markdown_to_pdf(content)
+            if result.get("status") != "success":
+                logger.error("PDF worker failed to render report: %s", result.get("error"))
+            elif ready_path:
+                _write_ready_file(ready_path, os.path.basename(result["file_path"]))
+        except OSError as e:
+            logger.error("PDF worker could not record the rendered report: %s", e)
+        finally:
+            if marker_path:
+                try:
+                    os.remove(marker_path)
+                except OSError:
+                    pass
+
+
+def _write_ready_file(ready_path: str, filename: str) -> None:
+    """Atomically write the rendered PDF's filename to ready_path."""
+    tmp_path = f"{ready_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(filename)
+    os.replace(tmp_path, ready_path)
+
+
+def _ensure_started() -> Queue:
+    """Start the worker if it is not running and return its job queue. Caller must hold _lock."""
+    global _queue, _process
+    if _process is None or not _process.is_alive():
+        # spawn: the worker only needs the PDF stack, not a copy of the agent server's state
+        ctx = multiprocessing.get_context("spawn")
+        _queue = ctx.Queue()
+        _process = ctx.Process(target=_worker_main, args=(_queue,), name="pdf_worker", daemon=True)
+        _process.start()
+    assert _queue is not None
+    return _queue
+
+
+def start() -> None:
+    """
+    Start (and warm up) the worker ahead of the first submit, so its imports and renderer
+    setup overlap with report generation instead of delaying the first PDF. Idempotent.
+    """
+    with _lock:
+        _ensure_started()
+
+
+def submit(content: str, marker_path: str | None = None, ready_path: str | None = None) -> None:
+    """
+    Queue a Markdown report for PDF rendering and return immediately.
+
+    The worker is started on first use (and restarted if it died). ready_path, if given, receives
+    the rendered PDF's filename on success; marker_path, if given, is removed once the render
+    finishes, whether or not it succeeded.
+    """
+    with _lock:
+        _ensure_started().put((content, marker_path, ready_path))
@@ -1,11 +1,44 @@
+import asyncio
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, several times faster to parse
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+logger = logging.getLogger(__name__)
+
+
+def _file_stamp(file_path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed; used to invalidate the caches below."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_cached(file_path: str, _stamp: tuple[int, int] | None) -> str:
+    # One open + fstat + exactly-sized read, bypassing the buffered text layer
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _read_text(file_path: str) -> str:
+    """Read a UTF-8 text file, served from memory while its mtime and size are unchanged."""
+    return _read_text_cached(file_path, _file_stamp(file_path))
+
 
 def load_file_content(file_path: str, fallback: str = None) -> str:
     """
@@ -22,16 +55,33 @@ def load_file_content(file_path: str, fallback: str = None) -> str:
         str: The contents of the file or fallback.
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return f.read().strip()
+        # str.strip() hands back the same object when there is nothing to trim, so tight files are not copied
+        return _read_text(file_path).strip()
     except (OSError, FileNotFoundError) as e:
         if fallback is not None:
-            logging.warning(f"File not found or unreadable: {file_path}. Using fallback.")
+            logger.warning("File not found or unreadable: %s. Using fallback.", file_path)
             return fallback
-        logging.error(f"Error reading file {file_path}: {e}")
+        logger.error("Error reading file %s: %s", file_path, e)
         raise
 
 
+async def load_file_content_async(file_path: str, fallback: str = None) -> str:
+    """
+    Async variant of load_file_content for use from coroutines.
+
+    The read runs in a worker thread so it does not block the event loop; several files can be
+    loaded concurrently with asyncio.gather.
+
+    Args:
+        file_path (str): The path to the file to be read.
+        fallback (str, optional): Default content if file is missing.
+
+    Returns:
+        str: The contents of the file or fallback.
+    """
+    return await asyncio.to_thread(load_file_content, file_path, fallback)
+
+
 def _build_instruction_from_yaml(data: dict) -> str:
     """
     Build a single instruction string from a YAML instruction document.
@@ -90,23 +140,41 @@ def load_instructions_file(file_path: str, fallback: str = "Perform your tasks a
     """
     Loads agent instructions from a specified file with a default fallback.
     Supports .txt (raw text) and .yaml (structured role/objective/workflow/output_requirements).
+    Results are memoized per (file_path, fallback) and rebuilt when the file's mtime or size changes.
+    """
+    return _load_instructions_cached(file_path, fallback, _file_stamp(file_path))
+
+
+def load_instructions_files(
+    paths: list[str], fallback: str = "Perform your tasks as an expert agent."
+) -> dict[str, str]:
     """
+    Load several instruction files at once, overlapping their reads on a small thread pool.
+    Returns {path: instructions}; each entry is what load_instructions_file would return (and is cached the same way).
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip(paths, executor.map(lambda path: load_instructions_file(path, fallback), paths)))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_instructions_cached(file_path: str, fallback: str, _stamp: tuple[int, int] | None) -> str:
     if not os.path.isfile(file_path):
         if fallback is not None:
-            logging.warning(f"Instructions file not found: {file_path}. Using fallback.")
+            logger.warning("Instructions file not found: %s. Using fallback.", file_path)
             return fallback
         raise FileNotFoundError(f"Instructions file not found: {file_path}")
     if file_path.lower().endswith((".yaml", ".yml")):
         if yaml is None:
-            logging.warning("PyYAML not available; reading YAML file as plain text.")
+            logger.warning("PyYAML not available; reading YAML file as plain text.")
             return load_file_content(file_path, fallback=fallback)
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(_read_text(file_path), Loader=_YAML_LOADER)
             if not data:
                 return fallback or ""
             return _build_instruction_from_yaml(data)
         except Exception as e:
-            logging.warning(f"Failed to parse YAML instructions from {file_path}: {e}. Using fallback.")
+            logger.warning("Failed to parse YAML instructions from %s: %s. Using fallback.", file_path, e)
             return fallback or load_file_content(file_path, fallback=fallback)
     return load_file_content(file_path, fallback=fallback)
@@ -0,0 +1,73 @@
+import asyncio
+
+from shared.utils import file_loader
+from shared.utils.file_loader import (
+    load_file_content,
+    load_file_content_async,
+    load_instructions_file,
+    load_instructions_files,
+)
+
+
+def test_load_file_content_strips_and_falls_back(tmp_path):
+    path = tmp_path / "instructions.txt"
+    path.write_text("  Be thorough.\n", encoding="utf-8")
+
+    assert load_file_content(str(path)) == "Be thorough."
+    assert load_file_content(str(tmp_path / "missing.txt"), fallback="default") == "default"
+
+
+def test_load_instructions_file_builds_yaml_and_is_memoized(tmp_path, monkeypatch):
+    path = tmp_path / "instructions.yaml"
+    path.write_text("role: |\n  Security analyst.\nguidelines:\n  - Be specific.\n", encoding="utf-8")
+
+    first = load_instructions_file(str(path))
+    assert first == "Role:\nSecurity analyst.\n\nGuidelines:\n  - Be specific."
+
+    def fail(_path):
+        raise AssertionError("instructions should be served from the cache")
+
+    monkeypatch.setattr(file_loader, "_read_text", fail)
+    assert load_instructions_file(str(path)) == first
+
+
+def test_load_instructions_file_missing_uses_fallback(tmp_path):
+    assert load_instructions_file(str(tmp_path / "missing.yaml"), fallback="fallback") == "fallback"
+
+
+def test_load_instructions_file_reloads_when_file_changes(tmp_path):
+    path = tmp_path / "instructions.txt"
+    path.write_text("First version.", encoding="utf-8")
+    assert load_instructions_file(str(path)) == "First version."
+
+    path.write_text("Second, longer version.", encoding="utf-8")
+    assert load_instructions_file(str(path)) == "Second, longer version."
+
+
+def test_load_file_content_async_reads_concurrently(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"agent_{i}.txt"
+        path.write_text(f" Agent {i} \n", encoding="utf-8")
+        paths.append(str(path))
+
+    async def load_all():
+        return await asyncio.gather(*(load_file_content_async(p) for p in paths))
+
+    assert asyncio.run(load_all()) == ["Agent 0", "Agent 1", "Agent 2"]
+
+
+def test_load_instructions_files_matches_single_loads(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"agent_{i}.yaml"
+        path.write_text(f"role: Agent {i}.\n", encoding="utf-8")
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.yaml"))
+
+    loaded = load_instructions_files(paths, fallback="fallback")
+    assert list(loaded) == paths
+    assert loaded == {p: load_instructions_file(p, fallback="fallback") for p in paths}
+    assert loaded[paths[0]] == "Role:\nAgent 0."
+    assert loaded[paths[-1]] == "fallback"
+    assert load_instructions_files([]) == {}
@@ -0,0 +1,55 @@
+import asyncio
+
+import pymupdf
+
+from shared.tools import file_writer_tool
+from shared.tools.file_writer_tool import convert_markdown_to_pdf, convert_markdown_to_pdf_async, write_file
+
+
+def test_convert_markdown_to_pdf_reuses_cached_render(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "reports").mkdir()
+
+    first = convert_markdown_to_pdf("# Threat Model\n\nSpoofing of the API gateway.")
+    assert first["status"] == "success"
+    cached = list((tmp_path / "reports" / ".cache").glob("*.pdf"))
+    assert len(cached) == 1
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("identical content should not be rendered again")
+
+    monkeypatch.setattr(file_writer_tool, "_render_pdf", fail)
+    (tmp_path / first["file_path"]).unlink()
+    second = convert_markdown_to_pdf("# Threat Model\n\nSpoofing of the API gateway.")
+    assert second["status"] == "success"
+    assert (tmp_path / second["file_path"]).read_bytes() == cached[0].read_bytes()
+
+
+def test_write_file_saves_utf8_markdown(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = write_file("# Rapport\n\nÉlévation de privilèges ✓")
+    assert result["status"] == "success"
+    assert (tmp_path / result["file_path"]).read_text(encoding="utf-8") == "# Rapport\n\nÉlévation de privilèges ✓"
+
+
+def test_convert_markdown_to_pdf_async_renders_in_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "reports").mkdir()
+
+    result = asyncio.run(convert_markdown_to_pdf_async("# Async report"))
+    assert result["status"] == "success"
+    assert (tmp_path / result["file_path"]).read_bytes().startswith(b"%PDF")
+
+
+def test_render_pdf_embeds_relative_report_images(tmp_path, monkeypatch):
+    (tmp_path / "reports").mkdir()
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 8, 8), False)
+    pixmap.clear_with(200)
+    pixmap.save(str(tmp_path / "reports" / "threat_map_1.png"))
+    monkeypatch.setattr(file_writer_tool, "_IMAGE_ARCHIVE", pymupdf.Archive(str(tmp_path)))
+
+    pdf_path = tmp_path / "report.pdf"
+    file_writer_tool._render_pdf("# Report\n\n![Visual Threat Map](reports/threat_map_1.png)\n", str(pdf_path))
+    with pymupdf.open(pdf_path) as doc:
+        assert len(doc[0].get_images()) == 1
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from google.adk.events import Event, EventActions
+
+from agents.orchestrator.agent import CachingVerifier, EscalationChecker, PreEscalationGate, _report_digest
+
+REPORT = "# Threat Model\n\n| Threat | Risk |\n|---|---|\n| Spoofing | High |\n\nSummary paragraph."
+
+
+def _ctx(state: dict, session_id: str = "session-a") -> SimpleNamespace:
+    return SimpleNamespace(session=SimpleNamespace(id=session_id, state=state))
+
+
+async def _events(agent, state: dict, session_id: str = "session-a") -> list:
+    return [event async for event in agent._run_async_impl(_ctx(state, session_id))]
+
+
+def test_report_digest_ignores_whitespace_only():
+    assert _report_digest(REPORT, "s") == _report_digest(REPORT.replace("\n\n", "\n  \n\n"), "s")
+    assert _report_digest(REPORT, "s") != _report_digest(REPORT.replace("High", "Low"), "s")
+    assert _report_digest(REPORT, "s") != _report_digest(REPORT, "other-session")
+
+
+@pytest.mark.asyncio
+async def test_escalation_checker_records_approved_report_hash():
+    state = {"verification_feedback": {"status": "pass"}, "threat_model_report_content": REPORT}
+    (event,) = await _events(EscalationChecker(name="escalation_checker"), state)
+
+    assert event.actions.escalate
+    assert event.actions.state_delta == {"_last_passed_report_hash": _report_digest(REPORT, "session-a").hex()}
+
+
+@pytest.mark.asyncio
+async def test_pre_escalation_gate_only_skips_verification_for_the_unchanged_report():
+    gate = PreEscalationGate(name="pre_escalation_gate")
+    approved = _report_digest(REPORT, "session-a").hex()
+
+    (event,) = await _events(gate, {"_last_passed_report_hash": approved, "threat_model_report_content": REPORT})
+    assert event.actions.escalate
+    assert event.actions.state_delta["verification_feedback"] == {"status": "pass", "feedback": "cached"}
+
+    # A single edited block (here, the threats table) must go back through the verifier
+    edited = REPORT.replace("| Spoofing | High |", "| Spoofing | Low |")
+    (event,) = await _events(gate, {"_last_passed_report_hash": approved, "threat_model_report_content": edited})
+    assert not event.actions.escalate
+    assert not event.actions.state_delta
+
+
+@pytest.mark.asyncio
+async def test_caching_verifier_reuses_verdicts_within_a_session_only():
+    calls = []
+
+    async def run_async(ctx):
+        calls.append(ctx.session.id)
+        yield Event(
+            author="report_verifier_agent",
+            actions=EventActions(state_delta={"verification_feedback": {"status": "pass", "feedback": "ok"}}),
+        )
+
+    verifier = CachingVerifier(name="caching_report_verifier")
+    verifier._verifier = SimpleNamespace(run_async=run_async)
+    state = {"threat_model_report_content": REPORT}
+
+    await _events(verifier, state)
+    assert calls == ["session-a"]
+
+    # Same report in the same session (whitespace aside): cached verdict, no verifier call
+    (event,) = await _events(verifier, {"threat_model_report_content": REPORT + "\n\n"})
+    assert event.author == "caching_report_verifier"
+    assert event.actions.state_delta == {"verification_feedback": {"status": "pass", "feedback": "ok"}}
+    assert calls == ["session-a"]
+
+    # Edited report, or the same report in another session: verified again
+    await _events(verifier, {"threat_model_report_content": REPORT.replace("High", "Low")})
+    await _events(verifier, state, session_id="session-b")
+    assert calls == ["session-a", "session-a", "session-b"]
@@ -0,0 +1,110 @@
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import app.server as server
+from shared.tools.pdf_worker import PDF_PENDING_PREFIX, PDF_READY_PREFIX, pdf_session_token
+
+
+@pytest.fixture
+def client():
+    return TestClient(server.app)
+
+
+@pytest.fixture
+def reports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "project_root", tmp_path)
+    monkeypatch.setattr(server, "PDF_PENDING_WAIT_SECONDS", 0.0)
+    path = tmp_path / "reports"
+    path.mkdir()
+    return path
+
+
+def test_latest_pdf_is_pending_only_for_the_rendering_session(client, reports_dir):
+    (reports_dir / (PDF_PENDING_PREFIX + pdf_session_token("session-a"))).touch()
+    (reports_dir / "report_0000000000000002.pdf").write_bytes(b"%PDF")
+    (reports_dir / (PDF_READY_PREFIX + pdf_session_token("session-b"))).write_text("report_0000000000000002.pdf")
+
+    pending = client.get("/api/reports/latest-pdf", params={"session_id": "session-a"})
+    assert pending.status_code == 202
+    assert pending.json()["status"] == "pending"
+
+    ready = client.get("/api/reports/latest-pdf", params={"session_id": "session-b"})
+    assert ready.status_code == 200
+    assert ready.json()["filename"] == "report_0000000000000002.pdf"
+
+    assert client.get("/api/reports/latest-pdf", params={"session_id": "session-c"}).status_code == 404
+
+
+def test_latest_pdf_ignores_markers_left_by_a_dead_worker(client, reports_dir):
+    marker = reports_dir / (PDF_PENDING_PREFIX + pdf_session_token("session-a"))
+    marker.touch()
+    stale = time.time() - server.PDF_PENDING_MAX_AGE_SECONDS - 60
+    os.utime(marker, (stale, stale))
+    (reports_dir / "report_0000000000000001.pdf").write_bytes(b"%PDF")
+
+    response = client.get("/api/reports/latest-pdf")
+    assert response.status_code == 200
+    assert response.json()["filename"] == "report_0000000000000001.pdf"
+
+
+class _StubStream:
+    """Stands in for stream_query's StreamingResponse: only body_iterator is read."""
+
+    def __init__(self, chunks):
+        self.body_iterator = self._iterate(chunks)
+
+    @staticmethod
+    async def _iterate(chunks):
+        for chunk in chunks:
+            yield chunk
+
+
+def test_batch_query_collects_sse_frames_split_across_chunks(client, monkeypatch):
+    streams = {
+        "a": [b'data: {"author": "parser", "n"', b': 1}\n\ndata: {"n": 2}\n', b"\n"],
+        "b": ['data: {"error": "quota exhausted"}\n\n'],
+    }
+
+    async def stream_query(request):
+        return _StubStream(streams[request.session_id])
+
+    monkeypatch.setattr(server, "stream_query", stream_query)
+    response = client.post("/api/batch_query", json=[{"session_id": "a"}, {"session_id": "b"}])
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"session_id": "a", "events": [{"author": "parser", "n": 1}, {"n": 2}]},
+        {"session_id": "b", "events": [{"error": "quota exhausted"}], "error": "quota exhausted"},
+    ]
+
+
+def test_batch_query_rejects_duplicate_sessions_and_mixed_credentials(client):
+    duplicate = client.post("/api/batch_query", json=[{"session_id": "a"}, {"session_id": "a"}])
+    assert duplicate.status_code == 400
+
+    mixed = client.post(
+        "/api/batch_query",
+        json=[{"session_id": "a", "model_id": "gemini-2.5-pro"}, {"session_id": "b", "model_id": "gemini-2.5-flash"}],
+    )
+    assert mixed.status_code == 400
+    assert "same provider" in mixed.json()["detail"]
+
+
+def test_batch_query_reports_a_failed_item_in_its_own_slot(client, monkeypatch):
+    async def stream_query(request):
+        if request.session_id == "bad":
+            raise HTTPException(status_code=503, detail="Orchestrator unavailable")
+        return _StubStream([b'data: {"ok": true}\n\n'])
+
+    monkeypatch.setattr(server, "stream_query", stream_query)
+    response = client.post("/api/batch_query", json=[{"session_id": "bad"}, {"session_id": "good"}])
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"session_id": "bad", "events": [], "error": "Orchestrator unavailable"},
+        {"session_id": "good", "events": [{"ok": True}]},
+    ]
@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from shared.plugins.vertex_artifacts import VertexSaveFilesAsArtifactsPlugin
+
+MESSAGE = types.Content(
+    role="user", parts=[types.Part.from_bytes(data=b"\x89PNG", mime_type="image/png"), types.Part(text="Analyze")]
+)
+
+
+class FailingArtifactService:
+    async def save_artifact(self, **_kwargs):
+        raise AssertionError("uploads must stay inline when Vertex AI is not the backend")
+
+
+@pytest.mark.asyncio
+async def test_uploads_stay_inline_without_vertex(monkeypatch):
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "False")
+    plugin = VertexSaveFilesAsArtifactsPlugin()
+    ctx = SimpleNamespace(artifact_service=FailingArtifactService(), invocation_id="inv-1")
+
+    assert await plugin.on_user_message_callback(invocation_context=ctx, user_message=MESSAGE) is None
+
+
+@pytest.mark.asyncio
+async def test_vertex_backend_delegates_to_the_adk_plugin(monkeypatch):
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "True")
+    plugin = VertexSaveFilesAsArtifactsPlugin()
+    # Without an artifact service the ADK plugin hands the message back unchanged
+    ctx = SimpleNamespace(artifact_service=None, invocation_id="inv-1")
+
+    assert await plugin.on_user_message_callback(invocation_context=ctx, user_message=MESSAGE) is MESSAGE